@@ -7,12 +7,14 @@ This module provides a basic logging class that can be hooked up to
 the callbacks to provide a basic console logging program.
 """
 
+import queue
 import sys
 import threading
+import time
 from datetime import datetime
 from typing import Callable, List, Optional, Tuple
 
-from radalert._util.filter import FIRFilter
+from radalert._util.filter import FIRSumFilter
 from radalert._util.filter import IIRFilter
 from radalert._util.net import Gmcmap
 from radalert._util.net import Radmon
@@ -38,7 +40,7 @@ class LogBackend:
 
         self.averages = []
         for count in samples:
-            self.averages.append(FIRFilter(count, sum))
+            self.averages.append(FIRSumFilter(count))
 
     def radalert_status_callback(self, data: RadAlertStatus) -> None:
         """
@@ -73,6 +75,21 @@ class LogBackend:
         self.conversion = data.conversion_factor
 
 
+def _timespan(seconds: float) -> Tuple[float, str]:
+    """
+    Express a number of seconds in the largest sensible unit.
+    """
+    if seconds <= 60:
+        return (seconds, "s")
+    minutes = seconds / 60
+    if minutes <= 60:
+        return (minutes, "m")
+    hours = minutes / 60
+    if hours <= 24:
+        return (hours, "h")
+    return (hours / 24, "d")
+
+
 class ConsoleLogger:
     """
     Simple console-logging class for the Radiation Alert devices.
@@ -88,61 +105,50 @@ class ConsoleLogger:
         self._running = False
         self._thread_event = threading.Event()
 
+        # Lines are handed to a writer thread so that a slow terminal
+        # or pipe never stalls the logging loop. A None entry tells the
+        # writer to finish.
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=8)
+        self._writer: Optional[threading.Thread] = None
+        self._write_error: Optional[OSError] = None
+
+        # The set of averages is fixed, so the header never changes
+        table = ["time", "battery", "cpm/(mR/h)"]
+        for f in self.backend.averages:
+            span, unit = _timespan(f.size)
+            table.append(f"{span:.0f}{unit}-cnt\t{span:.0f}{unit}-cpm")
+        self._header = "\t".join(table)
+
     def __str__(self) -> str:
-        try:
-            if self.backend.last_update is None:
-                return ""
-            update_delay = datetime.now() - self.backend.last_update
-            if update_delay.total_seconds() > self.delay:
-                return ""
-
-            table = [
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                f"{self.backend.battery}%",
-                f"{self.backend.conversion}",
-            ]
-
-            for f in self.backend.averages:
-                total = f.value
-                if total is None:
-                    table.extend(["", ""])
-                else:
-                    average = total / len(f.values) * 60
-                    table.extend(
-                        [
-                            f"{total}",
-                            f"{average:.1f}",
-                        ]
-                    )
-
-            return "\t".join(table)
-        except:
+        if self.backend.last_update is None:
+            return ""
+        now = datetime.now()
+        update_delay = now - self.backend.last_update
+        if update_delay.total_seconds() > self.delay:
             return ""
 
-    def header(self) -> str:
-        def timespan(time: float) -> Tuple[float, str]:
-            if time <= 60:
-                return (time, "s")
-            time /= 60
-            if time <= 60:
-                return (time, "m")
-            time /= 60
-            if time <= 24:
-                return (time, "h")
-            time /= 24
-            return (time, "d")
+        table = [
+            now.strftime("%Y-%m-%d %H:%M:%S"),
+            f"{self.backend.battery}%",
+            str(self.backend.conversion),
+        ]
 
-        table = ["time", "battery", "cpm/(mR/h)"]
         for f in self.backend.averages:
-            ts = timespan(f.size)
-            table.extend(
-                [
-                    f"{ts[0]:.0f}{ts[1]}-cnt",
-                    f"{ts[0]:.0f}{ts[1]}-cpm",
-                ]
-            )
+            total = f.value
+            count = len(f.values)
+            if total is None or count == 0:
+                # The backend may not have fed this filter its first
+                # sample yet, so there is nothing to average
+                table.append("\t")
+            else:
+                average = total / count * 60
+                table.append(f"{total}\t{average:.1f}")
+
         return "\t".join(table)
 
+    def header(self) -> str:
+        return self._header
+
     def spin(self) -> None:
         """
         Spin our wheels periodically logging to the console.
@@ -151,20 +157,76 @@ class ConsoleLogger:
         execution can still continue.
         """
         if not self._running:
-            print(self.header())
+            self._writer = threading.Thread(target=self._write_lines, daemon=True)
+            self._writer.start()
+            self._emit(self.header())
             self._running = True
 
-        while self._running:
-            line = self.__str__()
-            if len(line) > 0:
-                print(line)
-            self._thread_event.wait(timeout=self.delay)
+        # Schedule against the monotonic clock so that time spent
+        # producing a line does not push every following line later
+        next_tick = time.monotonic()
+        try:
+            while self._running and self._write_error is None:
+                line = self.__str__()
+                if len(line) > 0:
+                    self._emit(line)
+                next_tick += self.delay
+                now = time.monotonic()
+                if next_tick < now:
+                    # Too far behind; skip the missed lines rather than
+                    # printing a burst of them
+                    next_tick = now
+                self._thread_event.wait(timeout=next_tick - now)
+        finally:
+            self._stop_writer()
+
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            self._running = False
+            raise error
 
     def stop(self) -> None:
         """Stop execution of the spin function."""
         self._running = False
         self._thread_event.set()
 
+    def _emit(self, line: str) -> None:
+        # Drop the line rather than block if the writer has fallen behind
+        try:
+            self._lines.put_nowait(line)
+        except queue.Full:
+            pass
+
+    def _stop_writer(self) -> None:
+        writer = self._writer
+        if writer is None:
+            return
+        # Only a live writer drains the queue, so never block on a
+        # full queue once it has exited
+        while writer.is_alive():
+            try:
+                self._lines.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        writer.join()
+        self._writer = None
+
+    def _write_lines(self) -> None:
+        try:
+            while True:
+                line = self._lines.get()
+                if line is None:
+                    break
+                sys.stdout.write(line + "\n")
+                if self._lines.empty():
+                    sys.stdout.flush()
+            sys.stdout.flush()
+        except OSError as e:
+            # Hand the failure (e.g. a closed pipe) back to spin()
+            self._write_error = e
+            self._thread_event.set()
+
 
 class GmcmapLogger:
     """
@@ -189,15 +251,17 @@ class GmcmapLogger:
             if update_delay.total_seconds() > self.delay:
                 return
 
-            avg_short = self.backend.averages[1].value
-            avg_long = self.backend.averages[2].value
+            short = self.backend.averages[1]
+            long = self.backend.averages[2]
+            avg_short = short.value
+            avg_long = long.value
             conversion = self.backend.conversion
 
             if avg_short is None or avg_long is None:
                 return
 
-            avg_short = avg_short / len(self.backend.averages[1].values) * 60
-            avg_long = avg_long / len(self.backend.averages[2].values) * 60
+            avg_short = avg_short / len(short.values) * 60
+            avg_long = avg_long / len(long.values) * 60
 
             usv: Optional[float] = None
             if conversion is not None:
@@ -256,12 +320,13 @@ class RadmonLogger:
             if update_delay.total_seconds() > self.delay:
                 return
 
-            avg_long = self.backend.averages[2].value
+            long = self.backend.averages[2]
+            avg_long = long.value
 
             if avg_long is None:
                 return
 
-            avg_long = avg_long / len(self.backend.averages[2].values) * 60
+            avg_long = avg_long / len(long.values) * 60
 
             self.send_values(avg_long)
         except Exception as e:
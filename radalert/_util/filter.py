@@ -5,27 +5,38 @@ Provides functions and classes that implement FIR and IIR filters.
 """
 
 import math
-from typing import Callable, List, Optional
+import operator
+from collections import deque
+from typing import Callable, Deque, Iterable, Optional, Sequence, Tuple
 
+_LN2 = math.log(2.0)
 
-def mean_arithmetic(values: List[float]) -> Optional[float]:
+
+def mean_arithmetic(values: Sequence[float]) -> Optional[float]:
     """Get the arithmetic mean of the input list."""
     if len(values) == 0:
         return None
     return sum(values) / len(values)
 
 
-def mean_geometric(values: List[float]) -> Optional[float]:
-    """Get the geometric mean of the input list."""
+def mean_geometric(values: Sequence[float]) -> Optional[float]:
+    """
+    Get the geometric mean of the input list.
+
+    The mean is computed in the log domain so that long lists cannot
+    overflow or underflow. Negative values raise a ValueError.
+    """
     if len(values) == 0:
         return None
-    mean = values[0]
-    for i in range(1, len(values)):
-        mean = math.pow(values[i] * math.pow(mean, i - 1), 1 / i)
-    return mean
+    smallest = min(values)
+    if smallest < 0:
+        raise ValueError(f"geometric mean is undefined for negative value {smallest}")
+    if smallest == 0:
+        return 0.0
+    return math.exp(math.fsum(map(math.log, values)) / len(values))
 
 
-def mean_quadradic(values: List[float]) -> Optional[float]:
+def mean_quadradic(values: Sequence[float]) -> Optional[float]:
     """Get the quadradic mean / RMS value of the input list."""
     if len(values) == 0:
         return None
@@ -45,10 +56,12 @@ class FIRFilter:
     be specified when the filter is initalized.
     """
 
+    __slots__ = ("size", "values", "function")
+
     def __init__(
         self,
         size: int,
-        function: Callable[[List[float]], Optional[float]] = mean_arithmetic,
+        function: Callable[[Sequence[float]], Optional[float]] = mean_arithmetic,
     ) -> None:
         """
         Create an FIR filter with the specified size and filtering function.
@@ -59,8 +72,9 @@ class FIRFilter:
         function is simply the arithmetic mean.
         """
         self.size: int = size
-        self.values: List[float] = []
-        self.function: Callable[[List[float]], Optional[float]] = function
+        # A bounded deque discards the oldest value in O(1) on append
+        self.values: Deque[float] = deque(maxlen=size)
+        self.function: Callable[[Sequence[float]], Optional[float]] = function
 
     def iterate(self, value: float) -> Optional[float]:
         """
@@ -68,8 +82,18 @@ class FIRFilter:
         filtered value.
         """
         self.values.append(value)
-        if len(self.values) > self.size:
-            self.values.pop(0)
+        return self.value
+
+    def extend(self, values: Iterable[float]) -> Optional[float]:
+        """
+        Add several values into the filter and return the final filtered
+        value.
+
+        Only the value after the last input is computed, which makes this
+        far cheaper than repeated calls to `iterate()` when bulk-loading
+        or replaying logged samples.
+        """
+        self.values.extend(values)
         return self.value
 
     @property
@@ -83,6 +107,165 @@ class FIRFilter:
         return self.function(self.values)
 
 
+class FIRSumFilter(FIRFilter):
+    """
+    FIR filter which returns the sum of its last "n" input values.
+
+    Equivalent to `FIRFilter(size, sum)`, but keeps a running total
+    that is updated as values enter and leave the window rather than
+    re-summing the whole window each time the value is read.
+    """
+
+    __slots__ = ("_sum",)
+
+    def __init__(self, size: int) -> None:
+        """
+        Create a summing FIR filter with the specified size.
+        """
+        super().__init__(size, sum)
+        self._sum: float = 0
+
+    def iterate(self, value: float) -> Optional[float]:
+        """
+        Add the specified value into the filter and return the updated
+        filtered value.
+        """
+        values = self.values
+        if len(values) == self.size:
+            self._sum -= values[0]
+        values.append(value)
+        self._sum += value
+        return self.value
+
+    def extend(self, values: Iterable[float]) -> Optional[float]:
+        """
+        Add several values into the filter and return the final filtered
+        value.
+        """
+        self.values.extend(values)
+        self._sum = sum(self.values)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        """
+        Get the sum of the values currently in the window.
+        """
+        return self._sum
+
+
+class FIRMeanFilter(FIRSumFilter):
+    """
+    FIR filter which returns the arithmetic mean of its last "n" values.
+
+    Equivalent to `FIRFilter(size, mean_arithmetic)`, but computed from
+    a running total in constant time.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, size: int) -> None:
+        """
+        Create an averaging FIR filter with the specified size.
+        """
+        super().__init__(size)
+        self.function = mean_arithmetic
+
+    @property
+    def value(self) -> Optional[float]:
+        """
+        Get the arithmetic mean of the values currently in the window.
+        """
+        if len(self.values) == 0:
+            return None
+        return self._sum / len(self.values)
+
+
+class FIRMaxFilter(FIRFilter):
+    """
+    FIR filter which returns the maximum of its last "n" input values.
+
+    Equivalent to `FIRFilter(size, max)`, but tracks the candidates for
+    the maximum in a monotonic deque so that updates take amortized
+    constant time and reading the value takes constant time.
+    """
+
+    __slots__ = ("_count", "_candidates")
+
+    # Comparison deciding if a new value supersedes an older candidate
+    _supersedes: Callable[[float, float], bool] = staticmethod(operator.ge)
+
+    def __init__(self, size: int) -> None:
+        """
+        Create a maximum-tracking FIR filter with the specified size.
+        """
+        super().__init__(size, max)
+        self._count: int = 0
+        self._candidates: Deque[Tuple[int, float]] = deque()
+
+    def iterate(self, value: float) -> Optional[float]:
+        """
+        Add the specified value into the filter and return the updated
+        filtered value.
+        """
+        self.values.append(value)
+        candidates = self._candidates
+        supersedes = self._supersedes
+        while candidates and supersedes(value, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((self._count, value))
+        self._count += 1
+        if candidates[0][0] <= self._count - 1 - self.size:
+            candidates.popleft()
+        return candidates[0][1]
+
+    def extend(self, values: Iterable[float]) -> Optional[float]:
+        """
+        Add several values into the filter and return the final filtered
+        value.
+        """
+        window = self.values
+        window.extend(values)
+        candidates = self._candidates
+        candidates.clear()
+        supersedes = self._supersedes
+        for index, value in enumerate(window):
+            while candidates and supersedes(value, candidates[-1][1]):
+                candidates.pop()
+            candidates.append((index, value))
+        self._count = len(window)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        """
+        Get the extreme value currently in the window.
+        """
+        if not self._candidates:
+            return None
+        return self._candidates[0][1]
+
+
+class FIRMinFilter(FIRMaxFilter):
+    """
+    FIR filter which returns the minimum of its last "n" input values.
+
+    Equivalent to `FIRFilter(size, min)`, using the same monotonic deque
+    approach as FIRMaxFilter.
+    """
+
+    __slots__ = ()
+
+    _supersedes: Callable[[float, float], bool] = staticmethod(operator.le)
+
+    def __init__(self, size: int) -> None:
+        """
+        Create a minimum-tracking FIR filter with the specified size.
+        """
+        super().__init__(size)
+        self.function = min
+
+
 class IIRFilter:
     """
     Implementation of an IIR (infinite impulse response) filter.
@@ -99,6 +282,8 @@ class IIRFilter:
     values and observe the filter output.
     """
 
+    __slots__ = ("_coefficient", "_gain", "value")
+
     def __init__(self, coefficient: float) -> None:
         """
         Create an IIR filter with the specified decay coefficient.
@@ -109,9 +294,22 @@ class IIRFilter:
         familiar representations can also be used by calling the various
         `create_from_xxx` functions instead.
         """
-        self.coefficient: float = coefficient
+        self.coefficient = coefficient
         self.value: Optional[float] = None
 
+    @property
+    def coefficient(self) -> float:
+        """
+        Fraction of the filter state preserved after each iteration.
+        """
+        return self._coefficient
+
+    @coefficient.setter
+    def coefficient(self, coefficient: float) -> None:
+        self._coefficient: float = coefficient
+        # Fraction of each new input mixed into the state
+        self._gain: float = 1 - coefficient
+
     def iterate(self, value: float) -> float:
         """
         Mix the provided value into the IIR filter, advancing its state
@@ -119,10 +317,28 @@ class IIRFilter:
         """
         if self.value is None:
             self.value = value
-        self.value *= self.coefficient
-        self.value += value * (1 - self.coefficient)
+            return value
+        self.value += (value - self.value) * self._gain
         return self.value
 
+    def extend(self, values: Iterable[float]) -> Optional[float]:
+        """
+        Mix several values into the IIR filter, advancing its state by
+        one iteration per value, and return the final filter output.
+
+        The loop runs entirely on local variables and only stores the
+        state once at the end, which makes this considerably cheaper than
+        repeated calls to `iterate()` when replaying logged samples.
+        """
+        gain = self._gain
+        state = self.value
+        for value in values:
+            if state is None:
+                state = value
+            state += (value - state) * gain
+        self.value = state
+        return state
+
     @staticmethod
     def create_from_time_constant(iterations: float) -> "IIRFilter":
         """
@@ -131,8 +347,7 @@ class IIRFilter:
         The time-constant defines how many iterations it will take for
         the filter to decay to a value of 1/e times its original value.
         """
-        coefficient = IIRFilter.time_constant_to_coefficient(iterations)
-        return IIRFilter(coefficient)
+        return IIRFilter._create_from_exponent(-1 / iterations)
 
     @staticmethod
     def create_from_half_life(iterations: float) -> "IIRFilter":
@@ -142,8 +357,7 @@ class IIRFilter:
         The half-life defines how many iterations it will take for the
         filter to decay to a value of 1/2 times its original value.
         """
-        coefficient = IIRFilter.half_life_to_coefficient(iterations)
-        return IIRFilter(coefficient)
+        return IIRFilter._create_from_exponent(-_LN2 / iterations)
 
     @staticmethod
     def create_from_decay_params(target: float, iterations: float) -> "IIRFilter":
@@ -154,8 +368,20 @@ class IIRFilter:
         the filter to decay to a value of 1/target times its original
         value.
         """
-        coefficient = IIRFilter.decay_params_to_coefficient(target, iterations)
-        return IIRFilter(coefficient)
+        return IIRFilter._create_from_exponent(math.log(target) / iterations)
+
+    @staticmethod
+    def _create_from_exponent(exponent: float) -> "IIRFilter":
+        """
+        Create an IIR filter whose coefficient is `exp(exponent)`.
+
+        Long time constants give coefficients very close to 1, where
+        `1 - coefficient` cancels away most of its precision. The gain is
+        instead computed directly with `expm1()`.
+        """
+        filt = IIRFilter(math.exp(exponent))
+        filt._gain = -math.expm1(exponent)
+        return filt
 
     @staticmethod
     def time_constant_to_coefficient(iterations: float) -> float:
@@ -188,7 +414,7 @@ class IIRFilter:
         a value of 1/2 times its original value in the number of
         specified iterations.
         """
-        return math.exp(-math.log(2) / iterations)
+        return math.exp(-_LN2 / iterations)
 
     @staticmethod
     def coefficient_to_half_life(coefficient: float) -> float:
@@ -199,7 +425,7 @@ class IIRFilter:
         given coefficient to decay to a value of 1/2 times its original
         value.
         """
-        return -math.log(2) / math.log(coefficient)
+        return -_LN2 / math.log(coefficient)
 
     @staticmethod
     def decay_params_to_coefficient(target: float, iterations: float) -> float:
@@ -210,7 +436,7 @@ class IIRFilter:
         a value of target times its original value in the number of
         specified iterations.
         """
-        return math.exp(-math.log(1 / target) / iterations)
+        return math.exp(math.log(target) / iterations)
 
     @staticmethod
     def coefficient_to_decay_iters(coefficient: float, target: float) -> float:
@@ -221,4 +447,4 @@ class IIRFilter:
         given coefficient to decay to a value of 1/target times its
         original value.
         """
-        return -math.log(1 / target) / math.log(coefficient)
+        return math.log(target) / math.log(coefficient)
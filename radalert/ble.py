@@ -13,8 +13,10 @@ state is good enough for most basic work :)
 import sys
 import struct
 import datetime
+import operator
+from collections import deque
 from enum import Enum
-from typing import Callable, Dict, List, NoReturn, Optional, Tuple, Union
+from typing import Callable, Deque, Dict, List, NoReturn, Optional, Tuple, Union
 from bluepy.btle import Peripheral
 
 from radalert import generic
@@ -28,6 +30,8 @@ class RadAlertLEStatus(generic.RadAlertStatus):
     Not all fields in the status packet have been deciphered yet.
     """
 
+    __slots__ = ("_data", "_alarm_state", "type")
+
     # yapf: disable
     _MODE_DISPLAY_INFO: Dict[int, Tuple[str, Callable[[float], float]]] = {
         0:  ("cpm",    lambda x: x),       # CPM -> CPM
@@ -39,11 +43,47 @@ class RadAlertLEStatus(generic.RadAlertStatus):
     }
     # yapf: enable
 
-    def __init__(self, bytestr: bytes) -> None:
+    _STRUCT: struct.Struct = struct.Struct("<2IHHB3B")
+
+    # Decoded (power, alarm_alerting, alarm_set, alarm_silenced, unknown)
+    # fields for every possible value of the status byte
+    _STATUS_TABLE: Tuple[Tuple[int, bool, bool, bool, int], ...] = tuple(
+        (
+            (status >> 0) & 7,
+            bool((status >> 3) & 1),
+            bool((status >> 4) & 1),
+            bool((status >> 5) & 1),
+            (status >> 6) & 3,
+        )
+        for status in range(256)
+    )
+
+    # Names and usual values of the unknown fields
+    # yapf: disable
+    _UNKNOWN_EXPECTED: Tuple[Tuple[str, int], ...] = (
+        ("unknown", 0),  # 2-bit value or 2 flags?
+        ("unk1",    0),  # 1-byte value?
+    )
+    # yapf: enable
+    _UNKNOWN_GETTER = operator.itemgetter(*(name for name, _ in _UNKNOWN_EXPECTED))
+    _UNKNOWN_VALUES: Tuple[int, ...] = tuple(expect for _, expect in _UNKNOWN_EXPECTED)
+
+    def __init__(
+        self, bytestr: generic.Buffer, offset: int = 0, validate: bool = True
+    ) -> None:
         """
-        Create a status object from a bytes object.
+        Create a status object from a bytes-like object.
+
+        The packet is read starting at `offset` bytes into the buffer,
+        allowing it to be decoded in place without slicing. The values
+        are range-checked unless `validate` is cleared.
         """
-        self._data: Dict[str, Union[int, bool]] = RadAlertLEStatus.unpack(bytestr)
+        self._data: Dict[str, Union[int, bool]] = RadAlertLEStatus.unpack(
+            bytestr, offset, validate
+        )
+        self._alarm_state: generic.RadAlertStatus.AlarmState = (
+            RadAlertLEStatus._decode_alarm_state(self._data)
+        )
         self.type: str = "status"
 
     @property
@@ -86,16 +126,7 @@ class RadAlertLEStatus(generic.RadAlertStatus):
         """
         Current device alarm state (disabled, set, alerting, etc.)
         """
-
-        # This chain of conditions must be kept in priority order
-        if self._data["alarm_silenced"]:
-            return RadAlertLEStatus.AlarmState.SILENCED
-        elif self._data["alarm_alerting"]:
-            return RadAlertLEStatus.AlarmState.ALERTING
-        elif self._data["alarm_set"]:
-            return RadAlertLEStatus.AlarmState.SET
-        else:
-            return RadAlertLEStatus.AlarmState.DISABLED
+        return self._alarm_state
 
     @property
     def display_value(self) -> float:
@@ -125,20 +156,44 @@ class RadAlertLEStatus(generic.RadAlertStatus):
         """
         Unknown data contained within the packet.
         """
-        # yapf: disable
-        return [
-            (self._data["unknown"], 0),  # 2-bit value or 2 flags?
-            (self._data["unk1"], 0),     # 1-byte value?
-        ]
-        # yapf: enable
+        values = RadAlertLEStatus._UNKNOWN_GETTER(self._data)
+        return list(zip(values, RadAlertLEStatus._UNKNOWN_VALUES))
+
+    def _unknown_ok(self) -> bool:
+        """
+        Check if the unknown data has its usual expected values.
+        """
+        values = RadAlertLEStatus._UNKNOWN_GETTER(self._data)
+        return values == RadAlertLEStatus._UNKNOWN_VALUES
 
     @staticmethod
-    def unpack(bytestr: bytes) -> Dict[str, Union[int, bool]]:
+    def _decode_alarm_state(
+        data: Dict[str, Union[int, bool]]
+    ) -> generic.RadAlertStatus.AlarmState:
         """
-        Attempt to unpack a status packet.
+        Determine the alarm state from the unpacked alarm flags.
+        """
+        # This chain of conditions must be kept in priority order
+        if data["alarm_silenced"]:
+            return RadAlertLEStatus.AlarmState.SILENCED
+        elif data["alarm_alerting"]:
+            return RadAlertLEStatus.AlarmState.ALERTING
+        elif data["alarm_set"]:
+            return RadAlertLEStatus.AlarmState.SET
+        else:
+            return RadAlertLEStatus.AlarmState.DISABLED
+
+    @staticmethod
+    def unpack(
+        bytestr: generic.Buffer, offset: int = 0, validate: bool = True
+    ) -> Dict[str, Union[int, bool]]:
+        """
+        Attempt to unpack a status packet starting at the given offset.
 
         Returns a dictionary of unpacked values, or throws an exception
-        if this was not possible.
+        if this was not possible. Range-checking may be skipped by
+        clearing `validate`; RadAlertLE does this once synchronized to
+        the stream, since it then trusts the packet boundaries.
 
         Dictionary keys:
           * cps:    Number of counts measured in the last second
@@ -153,29 +208,31 @@ class RadAlertLEStatus(generic.RadAlertStatus):
           * alarm_silenced: Flag: radiation alarm has been silenced
           * unknown: 2-bit value or pair of flags with unknown purpose
         """
-        keys = ("cps", "value", "mode", "cpm_lo", "cpm_hi", "unk1", "status", "id")
-        values = struct.unpack("<2IHHB3B", bytestr)
-        data = dict(zip(keys, values))
-
-        # Merge the two CPM sub-fields into a single 3-byte value
-        data["cpm"] = data["cpm_lo"] + (data["cpm_hi"] << 16)
-        del data["cpm_lo"]
-        del data["cpm_hi"]
+        fields = RadAlertLEStatus._STRUCT.unpack_from(bytestr, offset)
+        cps, value, mode, cpm_lo, cpm_hi, unk1, status, id_ = fields
 
         # Unpack the status byte into its individual fields
-        status = data["status"]
+        status_fields = RadAlertLEStatus._STATUS_TABLE[status]
+        power, alerting, alarm_set, silenced, unknown = status_fields
 
         # yapf: disable
-        data["power"]          =      (status >> 0) & 7
-        data["alarm_alerting"] = bool((status >> 3) & 1)
-        data["alarm_set"]      = bool((status >> 4) & 1)
-        data["alarm_silenced"] = bool((status >> 5) & 1)
-        data["unknown"]        =      (status >> 6) & 3
+        data: Dict[str, Union[int, bool]] = {
+            "cps":            cps,
+            "value":          value,
+            "mode":           mode,
+            "unk1":           unk1,
+            "id":             id_,
+            "cpm":            cpm_lo + (cpm_hi << 16),  # 3-byte value
+            "power":          power,
+            "alarm_alerting": alerting,
+            "alarm_set":      alarm_set,
+            "alarm_silenced": silenced,
+            "unknown":        unknown,
+        }
         # yapf: enable
 
-        del data["status"]
-
-        RadAlertLEStatus._validate(data)
+        if validate:
+            RadAlertLEStatus._validate(data)
         return data
 
     @staticmethod
@@ -211,6 +268,28 @@ class RadAlertLEStatus(generic.RadAlertStatus):
         if data["mode"] not in RadAlertLEStatus._MODE_DISPLAY_INFO:
             raise ValueError(f'mode = {data["mode"]} is not a known state')
 
+    @staticmethod
+    def _plausible(bytestr: generic.Buffer, offset: int = 0) -> bool:
+        """
+        Cheaply check if a status packet could begin at the given offset.
+
+        Performs the same range checks as _validate() but works directly
+        on the raw fields, without building a dictionary or raising an
+        exception. Useful for quickly scanning a buffer for candidate
+        packet boundaries.
+        """
+        fields = RadAlertLEStatus._STRUCT.unpack_from(bytestr, offset)
+        cps, _, mode, cpm_lo, cpm_hi, _, status, _ = fields
+        power, alerting, alarm_set, silenced, _ = RadAlertLEStatus._STATUS_TABLE[status]
+        return (
+            cps <= 7500 * 100
+            and cpm_lo + (cpm_hi << 16) <= 7500 * 60
+            and power <= 5
+            and (alarm_set or not alerting)
+            and (alerting or not silenced)
+            and mode in RadAlertLEStatus._MODE_DISPLAY_INFO
+        )
+
 
 class RadAlertLEQuery(generic.RadAlertQuery):
     """
@@ -219,11 +298,32 @@ class RadAlertLEQuery(generic.RadAlertQuery):
     Not all fields in the query packet have been deciphered yet.
     """
 
-    def __init__(self, bytestr: bytes) -> None:
+    __slots__ = ("_data", "type")
+
+    _STRUCT: struct.Struct = struct.Struct("<I4HI")
+
+    # Query packets can be told apart from status packets by this header
+    _HEADER: bytes = b"\xff\xff\xff\xff"
+
+    # Names and usual values of the unknown fields
+    # yapf: disable
+    _UNKNOWN_EXPECTED: Tuple[Tuple[str, int], ...] = (
+        ("unk1", 0xFFFFFFFF),  # Packet header?
+        ("unk2", 0),           # 2-byte value?
+        ("unk4", 0xFFFFFFFF),  # Packet trailer?
+    )
+    # yapf: enable
+    _UNKNOWN_GETTER = operator.itemgetter(*(name for name, _ in _UNKNOWN_EXPECTED))
+    _UNKNOWN_VALUES: Tuple[int, ...] = tuple(expect for _, expect in _UNKNOWN_EXPECTED)
+
+    def __init__(self, bytestr: generic.Buffer, offset: int = 0) -> None:
         """
-        Create a status object from a bytes object.
+        Create a query object from a bytes-like object.
+
+        The packet is read starting at `offset` bytes into the buffer,
+        allowing it to be decoded in place without slicing.
         """
-        self._data: Dict[str, int] = RadAlertLEQuery.unpack(bytestr)
+        self._data: Dict[str, int] = RadAlertLEQuery.unpack(bytestr, offset)
         self.type: str = "query"
 
     @property
@@ -345,18 +445,20 @@ class RadAlertLEQuery(generic.RadAlertQuery):
         """
         Unknown data contained within the packet.
         """
-        # yapf: disable
-        return [
-            (self._data["unk1"], 0xFFFFFFFF),  # Packet header?
-            (self._data["unk2"], 0),           # 2-byte value?
-            (self._data["unk4"], 0xFFFFFFFF),  # Packet trailer?
-        ]
-        # yapf: enable
+        values = RadAlertLEQuery._UNKNOWN_GETTER(self._data)
+        return list(zip(values, RadAlertLEQuery._UNKNOWN_VALUES))
+
+    def _unknown_ok(self) -> bool:
+        """
+        Check if the unknown data has its usual expected values.
+        """
+        values = RadAlertLEQuery._UNKNOWN_GETTER(self._data)
+        return values == RadAlertLEQuery._UNKNOWN_VALUES
 
     @staticmethod
-    def unpack(bytestr: bytes) -> Dict[str, int]:
+    def unpack(bytestr: generic.Buffer, offset: int = 0) -> Dict[str, int]:
         """
-        Attempt to unpack a query packet.
+        Attempt to unpack a query packet starting at the given offset.
 
         Returns a dictionary of unpacked values, or throws an exception
         if this was not possible.
@@ -370,7 +472,7 @@ class RadAlertLEQuery(generic.RadAlertQuery):
           * unk4:  Unknown value; always set to 0xFFFFFFFF on my unit
         """
         keys = ("unk1", "alarm", "unk2", "dead", "conv", "unk4")
-        values = struct.unpack("<I4HI", bytestr)
+        values = RadAlertLEQuery._STRUCT.unpack_from(bytestr, offset)
         data = dict(zip(keys, values))
 
         RadAlertLEQuery._validate(data)
@@ -415,20 +517,17 @@ class RadAlertLE(generic.RadAlert):
     (or ack if no last command), aside from that last observation...
     """
 
-    # yapf: disable
-    _COMMAND_STRING: Dict[str, str] = {
-        "query":     "?",
-        "terminate": "Z",
-        "ack":       "X",
-    }
-    # yapf: enable
-    _COMMAND_ENDL: str = "\n"
+    # Commands are kept pre-encoded and newline-terminated so they can
+    # be written to the device as-is
+    _QUERY: bytes = b"?\n"
+    _TERMINATE: bytes = b"Z\n"
+    _ACK: bytes = b"X\n"
 
     def _reset(self) -> None:
         self._peripheral: Optional[Peripheral] = None
         self._service: Optional[TransparentService] = None
-        self._command_buffer: List[str] = []
-        self._receive_buffer: bytes = b""
+        self._command_buffer: Deque[bytes] = deque()
+        self._receive_buffer: bytearray = bytearray()
         self._last_id: Optional[int] = None
         self._sync_count: int = 0
 
@@ -465,7 +564,7 @@ class RadAlertLE(generic.RadAlert):
         course of keeping the connection alive / current, but this method
         can be used to force an update.
         """
-        self._command_buffer.append(self._COMMAND_STRING["query"])
+        self._command_buffer.append(self._QUERY)
 
     def spin(self) -> NoReturn:
         """
@@ -482,24 +581,30 @@ class RadAlertLE(generic.RadAlert):
         """
         if self._peripheral is None:
             raise RuntimeError("Peripheral has not been initialized")
+        wait = self._peripheral.waitForNotifications
+        trigger_query = self.trigger_query
         while True:
             iteration: int = 0
-            while self._peripheral.waitForNotifications(8.5):
+            while wait(8.5):
                 iteration += 1
                 if iteration % 5 == 0:
-                    self.trigger_query()
+                    trigger_query()
             print("Timeout while waiting for BLE notification", file=sys.stderr)
 
-    def _decode(self) -> Union[None, RadAlertLEQuery, RadAlertLEStatus]:
-        if len(self._receive_buffer) < 16:
+    def _decode(
+        self, offset: int = 0, validate: bool = True
+    ) -> Union[None, RadAlertLEQuery, RadAlertLEStatus]:
+        # Decode directly out of the receive buffer rather than slicing
+        # off a copy of the packet first.
+        buffer: bytearray = self._receive_buffer
+        if len(buffer) - offset < 16:
             return None
-        packet: bytes = self._receive_buffer[0:16]
         data: Union[None, RadAlertLEQuery, RadAlertLEStatus] = None
 
-        if packet[0:4] == b"\xff\xff\xff\xff":
-            data = RadAlertLEQuery(packet)
+        if buffer.startswith(RadAlertLEQuery._HEADER, offset):
+            data = RadAlertLEQuery(buffer, offset)
         else:
-            data = RadAlertLEStatus(packet)
+            data = RadAlertLEStatus(buffer, offset, validate)
 
             if self._last_id is not None:
                 if (self._last_id + 1) % 256 != data.id:
@@ -509,56 +614,83 @@ class RadAlertLE(generic.RadAlert):
 
             self._last_id = data.id
 
-        if data is not None:
-            for value, expect in data._unknown:
-                if value != expect:
-                    print(
-                        f"NOTE: Data parsed from {self._receive_buffer.hex()}"
-                        " has unexpected unknown field values:"
-                        f" {data._unknown}",
-                        file=sys.stderr,
-                    )
-                    break
+        if data is not None and not data._unknown_ok():
+            print(
+                f"NOTE: Data parsed from {buffer[offset:].hex()}"
+                " has unexpected unknown field values:"
+                f" {data._unknown}",
+                file=sys.stderr,
+            )
 
         return data
 
     def _on_receive(self, bytestr: bytes) -> None:
-        self._receive_buffer += bytestr
+        self._receive_buffer.extend(bytestr)
         self._process()
-        while len(self._command_buffer) > 0:
-            message = self._command_buffer.pop(0)
-            self._send_command(message)
+        commands: Deque[bytes] = self._command_buffer
+        send_command = self._send_command
+        while commands:
+            send_command(commands.popleft())
 
     def _process(self) -> None:
-        self._synchronize()
-        while self._synchronized():
-            data: Union[None, RadAlertLEQuery, RadAlertLEStatus] = None
-
-            try:
-                data = self._decode()
-                self._receive_buffer = self._receive_buffer[16:]
-            except Exception as e:
-                print(
-                    "Failed to parse from:" f"{self._receive_buffer.hex()}\n{e}",
-                    file=sys.stderr,
-                )
-                self._desynchronize()
-
-            self._send_ack()
-            if isinstance(data, RadAlertLEStatus):
-                self.status_callback(data)
-            elif isinstance(data, RadAlertLEQuery):
-                self.query_callback(data)
-            else:
-                break
+        """
+        Decode and dispatch every complete packet in the receive buffer.
+
+        Packets are decoded in place, walking an offset through the
+        buffer, and the consumed bytes are dropped all at once at the
+        end. Any incomplete trailing packet is kept for next time. We
+        only try to (re)synchronize if we aren't synchronized to begin
+        with or if a packet fails to decode.
+        """
+        if not self._synchronized():
+            self._synchronize()
+
+        # Bind everything used per-packet to locals up front
+        buffer: bytearray = self._receive_buffer
+        decode = self._decode
+        send_ack = self._send_ack
+        synchronized = self._synchronized
+        status_callback = self.status_callback
+        query_callback = self.query_callback
+
+        offset: int = 0
+        try:
+            while synchronized():
+                if len(buffer) - offset < 16:
+                    send_ack()
+                    break
 
-    def _send_command(self, command: str) -> None:
+                data: Union[None, RadAlertLEQuery, RadAlertLEStatus] = None
+                try:
+                    data = decode(offset, validate=False)
+                except Exception as e:
+                    del buffer[:offset]
+                    offset = 0
+                    print(
+                        "Failed to parse from:" f"{buffer.hex()}\n{e}",
+                        file=sys.stderr,
+                    )
+                    self._desynchronize()
+                    send_ack()
+                    self._synchronize()
+                    continue
+
+                offset += 16
+                send_ack()
+                if isinstance(data, RadAlertLEStatus):
+                    status_callback(data)
+                elif isinstance(data, RadAlertLEQuery):
+                    query_callback(data)
+        finally:
+            del buffer[:offset]
+
+    def _send_command(self, command: bytes) -> None:
         if self._service is None:
             raise RuntimeError("Service has not been initialized")
-        self._service.send_string(command + self._COMMAND_ENDL)
+        self._service.send_bytes(command)
 
     def _send_ack(self) -> None:
-        self._command_buffer.append(self._COMMAND_STRING["ack"])
+        self._command_buffer.append(self._ACK)
 
     def _synchronize(self) -> None:
         """
@@ -571,8 +703,12 @@ class RadAlertLE(generic.RadAlert):
         and then resumed at some place that wasn't a packet boundary.
         In any case, drop bytes from the buffer until we can reliably
         start decoding packets again.
+
+        Status packets are validated while synchronizing since the
+        validation exceptions are what let us reject bad alignments.
         """
         while not self._synchronized():
+            self._skip_implausible()
             try:
                 if self._decode() is None:
                     break
@@ -580,10 +716,35 @@ class RadAlertLE(generic.RadAlert):
                     self._sync_count += 1
                     self._send_ack()
             except Exception:
-                self._receive_buffer = self._receive_buffer[1:]
+                del self._receive_buffer[:1]
                 self._sync_count = 0
                 self._last_id = None
 
+    def _skip_implausible(self) -> None:
+        """
+        Drop bytes from the start of the receive buffer which cannot
+        possibly begin a packet.
+
+        This produces the same end result as repeatedly trying (and
+        failing) to decode at each offset while synchronizing, but
+        avoids building and validating a full packet object for each
+        byte along the way.
+        """
+        buffer: bytearray = self._receive_buffer
+        end: int = len(buffer) - 15
+        offset: int = 0
+        while offset < end:
+            if buffer.startswith(RadAlertLEQuery._HEADER, offset):
+                break
+            if RadAlertLEStatus._plausible(buffer, offset):
+                break
+            offset += 1
+
+        if offset > 0:
+            del buffer[:offset]
+            self._sync_count = 0
+            self._last_id = None
+
     def _desynchronize(self) -> None:
         self._sync_count = 0
 
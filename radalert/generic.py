@@ -8,8 +8,13 @@ import datetime
 from enum import Enum
 from typing import Callable, Dict, Generator, List, NoReturn, Optional, Tuple, Union
 
+# Any of the bytes-like types that packets may be unpacked from
+Buffer = Union[bytes, bytearray, memoryview]
+
 
 class RadAlertStatus(metaclass=ABCMeta):
+    __slots__ = ()
+
     class AlarmState(Enum):
         """
         Enumeration of possible alarm states.
@@ -119,6 +124,8 @@ class RadAlertQuery(metaclass=ABCMeta):
     Not all fields in the query packet have been deciphered yet.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, bytestr: bytes) -> None:
         """
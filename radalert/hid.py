@@ -13,6 +13,9 @@ state is good enough for most basic work :)
 import sys
 import struct
 import datetime
+import functools
+import logging
+import operator
 import re
 import time
 from enum import Enum
@@ -21,6 +24,44 @@ from typing import Callable, Dict, Generator, List, NoReturn, Optional, Tuple, U
 import hid
 from radalert import generic
 
+logger = logging.getLogger(__name__)
+
+
+def _compile_fieldspec(
+    fieldspec: Tuple[Tuple[str, int, str], ...],
+    alignment: str = "",
+    x_as_unknown: bool = False,
+) -> Tuple[struct.Struct, Tuple[str, ...]]:
+    """
+    Build the Struct and field names needed to unpack a fieldspec.
+
+    A "fieldspec" definition is a tuple of (name, repeat, type) tuples
+    describing the layout of a packet. Repeated non-string elements get
+    a numeric suffix indicating which item they are.
+    """
+    format_str = alignment
+    field_names = []
+
+    for name, repeat, fmt in fieldspec:
+        if x_as_unknown and fmt == "x":
+            fmt = "B"
+
+        format_str = format_str + str(repeat) + fmt
+
+        if fmt == "x":
+            continue
+
+        if fmt == "s":
+            field_names.append(name)
+        else:
+            for i in range(0, repeat):
+                if repeat > 1:
+                    field_names.append(name + str(i))
+                else:
+                    field_names.append(name)
+
+    return struct.Struct(format_str), tuple(field_names)
+
 
 class RadAlertHIDStatus(generic.RadAlertStatus):
     """
@@ -29,22 +70,65 @@ class RadAlertHIDStatus(generic.RadAlertStatus):
     Not all fields in the status packet have been deciphered yet.
     """
 
+    # Display units and the divisor that scales the raw value into them
     # yapf: disable
-    _MODE_DISPLAY_INFO: Dict[int, Tuple[str, Callable[[float], float]]] = {
-        0:  ("cpm",    lambda x: x),       # CPM -> CPM
-        1:  ("cps",    lambda x: x/10),    # centi-CPS -> CPS
-        2:  ("µR/h",   lambda x: x),       # uR/h -> uR/h
-        3:  ("µSv/h",  lambda x: x/1000),  # nSv/h -> uS/h
-        20: ("counts", lambda x: x),       # counts -> counts
-        23: ("mR/h",   lambda x: x/1000),  # uR/h -> mR/h
+    _MODE_DISPLAY_INFO: Dict[int, Tuple[str, int]] = {
+        0:  ("cpm",    1),     # CPM -> CPM
+        1:  ("cps",    10),    # centi-CPS -> CPS
+        2:  ("µR/h",   1),     # uR/h -> uR/h
+        3:  ("µSv/h",  1000),  # nSv/h -> uS/h
+        20: ("counts", 1),     # counts -> counts
+        23: ("mR/h",   1000),  # uR/h -> mR/h
     }
     # yapf: enable
 
-    def __init__(self, bytestr: bytes) -> None:
-        """
-        Create a status object from a bytes object.
+    _STRUCT: struct.Struct = struct.Struct("<IBIBBI")
+    # Just the leading cps field, for cheap preflight checks
+    _CPS_STRUCT: struct.Struct = struct.Struct("<I")
+    _KEYS: Tuple[str, ...] = ("cps", "id", "value", "mode", "unknown1", "unknown2")
+
+    # Unpacked fields are stored directly in slots rather than a dict
+    __slots__ = ("_cps", "_id", "_value", "_mode", "_unknown1", "_unknown2", "type")
+    _cps: int
+    _id: int
+    _value: int
+    _mode: int
+    _unknown1: int
+    _unknown2: int
+
+    # Names and usual values of the unknown fields
+    # yapf: disable
+    _UNKNOWN_EXPECTED: Tuple[Tuple[str, int], ...] = (
+        ("_unknown1", 0),       # 8 bits?
+        ("_unknown2", 0x0000),  # 2 bytes? Number of memory locations used?
+    )
+    # yapf: enable
+    _UNKNOWN_GETTER = operator.attrgetter(*(name for name, _ in _UNKNOWN_EXPECTED))
+    _UNKNOWN_VALUES: Tuple[int, ...] = tuple(expect for _, expect in _UNKNOWN_EXPECTED)
+
+    def __init__(
+        self, bytestr: generic.Buffer, offset: int = 0, validate: bool = True
+    ) -> None:
         """
-        self._data: Dict[str, Union[int, bool]] = RadAlertHIDStatus.unpack(bytestr)
+        Create a status object from a bytes-like object.
+
+        The packet is read starting at `offset` bytes into the buffer,
+        allowing it to be decoded in place without slicing. Validation
+        may be skipped if the caller has already checked the packet with
+        _plausible().
+        """
+        # A single precompiled Struct call is several times faster on
+        # CPython than assembling the fields from individual bytes
+        (
+            self._cps,
+            self._id,
+            self._value,
+            self._mode,
+            self._unknown1,
+            self._unknown2,
+        ) = RadAlertHIDStatus._STRUCT.unpack_from(bytestr, offset)
+        if validate:
+            RadAlertHIDStatus._validate(self._cps, self._mode)
         self.type: str = "status"
 
     @property
@@ -52,7 +136,7 @@ class RadAlertHIDStatus(generic.RadAlertStatus):
         """
         Number of counts observed in the last second.
         """
-        return self._data["cps"]
+        return self._cps
 
     @property
     def cpm(self) -> float:
@@ -66,7 +150,7 @@ class RadAlertHIDStatus(generic.RadAlertStatus):
         """
         Rolling ID number of this packet.
         """
-        return self._data["id"]
+        return self._id
 
     @property
     def is_charging(self) -> bool:
@@ -96,10 +180,8 @@ class RadAlertHIDStatus(generic.RadAlertStatus):
 
         See also: display_units()
         """
-        mode = self._data["mode"]
-        value = self._data["value"]
-        info = RadAlertHIDStatus._MODE_DISPLAY_INFO[mode]
-        return info[1](value)
+        _, divisor = RadAlertHIDStatus._MODE_DISPLAY_INFO[self._mode]
+        return self._value / divisor
 
     @property
     def display_units(self) -> str:
@@ -108,26 +190,28 @@ class RadAlertHIDStatus(generic.RadAlertStatus):
 
         See also: display_value()
         """
-        mode = self._data["mode"]
-        info = RadAlertHIDStatus._MODE_DISPLAY_INFO[mode]
-        return info[0]
+        units, _ = RadAlertHIDStatus._MODE_DISPLAY_INFO[self._mode]
+        return units
 
     @property
     def _unknown(self) -> List[Tuple[int, int]]:
         """
         Unknown data contained within the packet.
         """
-        # yapf: disable
-        return [
-            (int(self._data["unknown1"]), 0),  # 8 bits?
-            (int(self._data["unknown2"]), 0x0000),  # 2 bytes? Number of memory locations used?
-        ]
-        # yapf: enable
+        values = RadAlertHIDStatus._UNKNOWN_GETTER(self)
+        return list(zip(values, RadAlertHIDStatus._UNKNOWN_VALUES))
+
+    def _unknown_ok(self) -> bool:
+        """
+        Check if the unknown data has its usual expected values.
+        """
+        values = RadAlertHIDStatus._UNKNOWN_GETTER(self)
+        return values == RadAlertHIDStatus._UNKNOWN_VALUES
 
     @staticmethod
-    def unpack(bytestr: bytes) -> Dict[str, Union[int, bool]]:
+    def unpack(bytestr: generic.Buffer, offset: int = 0) -> Dict[str, Union[int, bool]]:
         """
-        Attempt to unpack a status packet.
+        Attempt to unpack a status packet starting at the given offset.
 
         Returns a dictionary of unpacked values, or throws an exception
         if this was not possible.
@@ -140,19 +224,20 @@ class RadAlertHIDStatus(generic.RadAlertStatus):
           * unknown1: 8-bit value with unknown purpose
           * unknown2: 16-bit value with unknown purpose
         """
-        keys = ("cps", "id", "value", "mode", "unknown1", "unknown2")
-        values = struct.unpack("<IBIBBI", bytestr)
-        data = dict(zip(keys, values))
+        values = RadAlertHIDStatus._STRUCT.unpack_from(bytestr, offset)
+        data = dict(zip(RadAlertHIDStatus._KEYS, values))
 
-        RadAlertHIDStatus._validate(data)
+        RadAlertHIDStatus._validate(data["cps"], data["mode"])
         return data
 
     @staticmethod
-    def _validate(data: Dict[str, Union[int, bool]]) -> None:
+    def _validate(cps: int, mode: int) -> None:
         """
-        Check that the unpacked dictionary data is reasonable.
+        Check that the unpacked values are reasonable.
         """
-        if data["cps"] > 7500 * 100 or data["cps"] < 0:
+        # Both fields are unpacked as unsigned values, so only their
+        # upper bounds need to be checked.
+        if cps > 7500 * 100:
             # It isn't clear what the maximum value actually is, but the
             # manual says that the devices won't saturate in a field
             # 100 times the maximum reading. Its unlikely that the device
@@ -160,10 +245,25 @@ class RadAlertHIDStatus(generic.RadAlertStatus):
             # safe, lets assume it does. Maximum CPS specs are 7500 for
             # the 1000EC, 5000 for the Ranger, and 3923 for the Monitor
             # 200.
-            raise ValueError(f'cps = {data["cps"]} is unreasonably large or negative')
+            raise ValueError(f"cps = {cps} is unreasonably large")
 
-        if data["mode"] not in RadAlertHIDStatus._MODE_DISPLAY_INFO:
-            raise ValueError(f'mode = {data["mode"]} is not a known state')
+        if mode not in RadAlertHIDStatus._MODE_DISPLAY_INFO:
+            raise ValueError(f"mode = {mode} is not a known state")
+
+    @staticmethod
+    def _plausible(bytestr: generic.Buffer, offset: int = 0) -> bool:
+        """
+        Cheaply check if a status packet begins at the given offset.
+
+        Performs the same range checks as _validate() but works directly
+        on the raw bytes, without building a status object or raising
+        an exception. The caller must ensure a full packet is present.
+        """
+        (cps,) = RadAlertHIDStatus._CPS_STRUCT.unpack_from(bytestr, offset)
+        return (
+            cps <= 7500 * 100
+            and bytestr[offset + 9] in RadAlertHIDStatus._MODE_DISPLAY_INFO
+        )
 
 
 class RadAlertHIDQuery(generic.RadAlertQuery):
@@ -173,21 +273,121 @@ class RadAlertHIDQuery(generic.RadAlertQuery):
     Not all fields in the query packet have been deciphered yet.
     """
 
-    def __init__(self, bytestr: bytes) -> None:
+    # Decoded status flags for every possible value of the status byte
+    # yapf: disable
+    _STATUS_TABLE: Tuple[Dict[str, bool], ...] = tuple(
+        {
+            "auto_averaging":   bool((status >> 0) & 1),
+            "datalog_circular": bool((status >> 1) & 1),
+            "alarm_set":        bool((status >> 2) & 1),
+            "audible_clicks":   bool((status >> 3) & 1),
+            "audible_beeps":    bool((status >> 4) & 1),
+            "unk1":             bool((status >> 5) & 1),
+            "datalog_enabled":  bool((status >> 6) & 1),
+            "unk2":             bool((status >> 7) & 1),
+        }
+        for status in range(256)
+    )
+    # yapf: enable
+
+    # Layout of the query packet, unpacked once into _STRUCT. Unknown
+    # ("x") bytes are still unpacked so they can be inspected.
+    # yapf: disable
+    _FIELDS: Tuple[Tuple[str, int, str], ...] = (
+        ("serial",    7, "s"),          # Serial (ASCII):       00 31 30 31 39 34 38
+        ("unkA",      7, "x"),          # Unknown (ASCII):      00 00 43 6f 2d 36 30
+        ("unkB",      2, "x"),          # Unknown:              00 00
+        ("status",    1, "B"),          # Mode number:          11
+        ("alarm",     1, "H"),          # Alarm CPM:            2e 04
+        ("unkC",      2, "x"),          # Unknown:              00 00
+        ("day",       1, "B"),          # Calibration day:      01
+        ("unkD",      2, "x"),          # Unknown:              02 17
+        ("month",     1, "B"),          # Calibration month:    01
+        ("year",      1, "B"),          # Calibration year:     00
+        ("unkE",      1, "x"),          # Unknown:              00
+        ("contrast",  1, "B"),          # LCD contrast:         19
+        ("dead",  1, "H"),              # Recip. deadtime:      67 2B
+        ("unkF",      8, "H"),          # Recip. efficiencies
+                                        # of 8 isotopes (C-14
+                                        # S-35, Cs-137, P-32,
+                                        # Co-60, Sr/Y-90,
+                                        # I-131, Alpha):        10 27 10 27 10 27 10 27 10 27 10 27 10 27 10 27
+        ("count_duration", 1, "H"),     # Count mode time (s):  58 02
+        ("backlight_duration", 1, "B"), # Backlight time (s):   07
+        ("conv",      1, "H"),          # CPM/(mR/H) convers:   2e 04
+        ("datalog_interval",  1, "H"),  # Datalogging interval: 01 00
+        ("unkG",     11, "x"),          # Unknown:              ff ff ff ff ff ff ff ff ff ff ff
+    )
+    # yapf: enable
+    _STRUCT, _FIELD_NAMES = _compile_fieldspec(_FIELDS, "<", True)
+
+    # Names and usual values of the unknown fields
+    # yapf: disable
+    _UNKNOWN_EXPECTED: Tuple[Tuple[str, int], ...] = (
+        # Named isotope?
+        ("unkA0", ord('\0')), ("unkA1", ord('\0')),
+        ("unkA2", ord('C')), ("unkA3", ord('o')),
+        ("unkA4", ord('-')), ("unkA5", ord('6')),
+        ("unkA6", ord('0')),
+
+        #  Always zero?
+        ("unkB0", 0), ("unkB1", 0),
+
+        # Always zero?
+        ("unk1", 0),
+
+        # Always zero?
+        ("unk2", 0),
+
+        # Always zero?
+        ("unkC0", 0), ("unkC1", 0),
+
+        # Always 0x217?
+        ("unkD0", 0x02), ("unkD1", 0x17),
+
+        # Always zero?
+        ("unkE", 0),
+
+        # Calibration data (reciprocal efficiencies?) for 8
+        # pre-programmed isotopes?
+        # C-14, S-35, Cs-137, P-32, Co-60, Sr/Y-90, I-131, Alpha
+        ("unkF0", 0x2710), ("unkF1", 0x2710),
+        ("unkF2", 0x2710), ("unkF3", 0x2710),
+        ("unkF4", 0x2710), ("unkF5", 0x2710),
+        ("unkF6", 0x2710), ("unkF7", 0x2710),
+
+        # Always 0xFF list?
+        ("unkG0", 0xFF), ("unkG1", 0xFF),
+        ("unkG2", 0xFF), ("unkG3", 0xFF),
+        ("unkG4", 0xFF), ("unkG5", 0xFF),
+        ("unkG6", 0xFF), ("unkG7", 0xFF),
+        ("unkG8", 0xFF), ("unkG9", 0xFF),
+        ("unkG10", 0xFF),
+    )
+    # yapf: enable
+    _UNKNOWN_GETTER = operator.itemgetter(*(name for name, _ in _UNKNOWN_EXPECTED))
+    _UNKNOWN_VALUES: Tuple[int, ...] = tuple(expect for _, expect in _UNKNOWN_EXPECTED)
+
+    def __init__(self, bytestr: generic.Buffer, offset: int = 0) -> None:
         """
-        Create a status object from a bytes object.
+        Create a query object from a bytes-like object.
+
+        The packet is read starting at `offset` bytes into the buffer,
+        allowing it to be decoded in place without slicing.
         """
-        self._data: Dict[str, Union[str, int, bool]] = RadAlertHIDQuery.unpack(bytestr)
+        self._data: Dict[str, Union[str, int, bool]] = RadAlertHIDQuery.unpack(
+            bytestr, offset
+        )
         self.type: str = "query"
 
-    @property
+    @functools.cached_property
     def alarm_is_set(self) -> bool:
         """
         Flag indicating if the device's alarm has been set.
         """
         return bool(self._data["alarm_set"])
 
-    @property
+    @functools.cached_property
     def auto_averaging_enabled(self) -> bool:
         """
         Flag indicating if the device's auto-averaging mode is enabled.
@@ -200,51 +400,49 @@ class RadAlertHIDQuery(generic.RadAlertQuery):
         """
         return bool(self._data["auto_averaging"])
 
-    @property
+    @functools.cached_property
     def alarm_level(self) -> int:
         """
         Current alarm level in CPS (even if alarm is disabled).
         """
         return int(self._data["alarm"])
 
-    @property
+    @functools.cached_property
     def audible_beeps(self) -> bool:
         """
         Flag indicatating if the device will produce audible beeps.
         """
         return bool(self._data["audible_beeps"])
 
-    @property
+    @functools.cached_property
     def audible_clicks(self) -> bool:
         """
         Flag indicating if the device will produce audible detection clicks.
         """
         return bool(self._data["audible_clicks"])
 
-    @property
+    @functools.cached_property
     def backlight_duration(self) -> int:
         """
         Number of seconds that the backlight will remain on.
         """
         return int(self._data["backlight_duration"])
 
-    @property
+    @functools.cached_property
     def calibration_date(self) -> Optional[datetime.datetime]:
         """
         Return the date of last calibration, or None if not set.
         """
-        default_cal_date = datetime.datetime(2000, 1, 1)
-        calibration_date = datetime.datetime(
-            int(self._data["year"]) + 2000,
-            int(self._data["month"]),
-            int(self._data["day"]),
-        )
-        if calibration_date == default_cal_date:
+        year = int(self._data["year"])
+        month = int(self._data["month"])
+        day = int(self._data["day"])
+        # The device reports 2000-01-01 when no calibration is stored
+        if (year, month, day) == (0, 1, 1):
             return None
         else:
-            return calibration_date
+            return datetime.datetime(year + 2000, month, day)
 
-    @property
+    @functools.cached_property
     def contrast(self) -> float:
         """
         Display contrast percentage.
@@ -252,7 +450,7 @@ class RadAlertHIDQuery(generic.RadAlertQuery):
         # TODO: What is maximum contrast?
         return int(self._data["contrast"]) / 64.0
 
-    @property
+    @functools.cached_property
     def conversion_factor(self) -> float:
         """
         Conversion factor from CPM to mR/h.
@@ -262,42 +460,42 @@ class RadAlertHIDQuery(generic.RadAlertQuery):
         """
         return int(self._data["conv"])
 
-    @property
+    @functools.cached_property
     def count_duration(self) -> int:
         """
         Number of seconds the device will perform a timed count for.
         """
         return int(self._data["count_duration"])
 
-    @property
+    @functools.cached_property
     def datalog_enabled(self) -> bool:
         """
         Flag indicating if the datalog function is enabled.
         """
         return bool(self._data["datalog_enabled"])
 
-    @property
+    @functools.cached_property
     def datalog_interval(self) -> int:
         """
         Number of minutes between datalog samples.
         """
         return int(self._data["datalog_interval"])
 
-    @property
+    @functools.cached_property
     def datalog_is_circular(self) -> bool:
         """
         Flag indicating if the datalog writes to a circular buffer.
         """
         return bool(self._data["datalog_circular"])
 
-    @property
+    @functools.cached_property
     def deadtime(self) -> float:
         """
         Tube deadtime in seconds.
         """
         return 1 / int(self._data["dead"])
 
-    @property
+    @functools.cached_property
     def serial_number(self) -> int:
         """
         Serial number of the device.
@@ -309,93 +507,15 @@ class RadAlertHIDQuery(generic.RadAlertQuery):
         """
         Unknown data contained within the packet.
         """
-        # yapf: disable
-        return [
-            # Named isotope?
-            (int(self._data["unkA1"]), ord('\0')), (int(self._data["unkA2"]), ord('\0')),
-            (int(self._data["unkA3"]), ord('C')), (int(self._data["unkA4"]), ord('o')),
-            (int(self._data["unkA5"]), ord('-')), (int(self._data["unkA6"]), ord('6')),
-            (int(self._data["unkA7"]), ord('0')),
-
-            #  Always zero?
-            (int(self._data["unkB1"]), 0), (int(self._data["unkB2"]), 0),
-
-            # Always zero?
-            (int(self._data["unk1"]), 0),
-
-            # Always zero?
-            (int(self._data["unk2"]), 0),
-
-            # Always zero?
-            (int(self._data["unkC1"]), 0), (int(self._data["unkC2"]), 0),
-
-            # Always 0x217?
-            (int(self._data["unkD1"]), 0x02), (int(self._data["unkD2"]), 0x17),
-
-            # Always zero?
-            (int(self._data["unkE"]), 0),
-
-            # Calibration data (reciprocal efficiencies?) for 8
-            # pre-programmed isotopes?
-            # C-14, S-35, Cs-137, P-32, Co-60, Sr/Y-90, I-131, Alpha
-            (int(self._data["unkF1"]), 0x2710), (int(self._data["unkF2"]), 0x2710),
-            (int(self._data["unkF3"]), 0x2710), (int(self._data["unkF4"]), 0x2710),
-            (int(self._data["unkF5"]), 0x2710), (int(self._data["unkF6"]), 0x2710),
-            (int(self._data["unkF7"]), 0x2710), (int(self._data["unkF8"]), 0x2710),
-
-            # Always 0xFF list?
-            (int(self._data["unkG1"]), 0xFF), (int(self._data["unkG2"]), 0xFF),
-            (int(self._data["unkG3"]), 0xFF), (int(self._data["unkG4"]), 0xFF),
-            (int(self._data["unkG5"]), 0xFF), (int(self._data["unkG6"]), 0xFF),
-            (int(self._data["unkG7"]), 0xFF), (int(self._data["unkG8"]), 0xFF),
-            (int(self._data["unkG9"]), 0xFF), (int(self._data["unkG10"]), 0xFF),
-            (int(self._data["unkG11"]), 0xFF)
-        ]
-        # yapf: enable
+        values = RadAlertHIDQuery._UNKNOWN_GETTER(self._data)
+        return list(zip(map(int, values), RadAlertHIDQuery._UNKNOWN_VALUES))
 
     @staticmethod
-    def _unpack_to_dict(
-        fieldspec: List[Tuple[str, int, str]],
-        bytestr: bytes,
-        alignment: str = "",
-        x_as_unknown: bool = False,
+    def unpack(
+        bytestr: generic.Buffer, offset: int = 0
     ) -> Dict[str, Union[str, int, bool]]:
         """
-        Helper method to unpack a byte string into a dictionary.
-
-        Use a "fieldspec" definition (list of (name, repeat, type) tuples)
-        to unpack a byte string into a dictionary. Repeated non-string
-        elements get a numeric suffix indicating which item they are.
-        """
-        format_str = alignment
-        field_names = []
-
-        for name, repeat, fmt in fieldspec:
-            if x_as_unknown and fmt == "x":
-                fmt = "B"
-
-            format_str = format_str + str(repeat) + fmt
-
-            if fmt == "x":
-                continue
-
-            if fmt == "s":
-                field_names.append(name)
-            else:
-                for i in range(0, repeat):
-                    if repeat > 1:
-                        field_names.append(name + str(i))
-                    else:
-                        field_names.append(name)
-
-        values = struct.unpack(format_str, bytestr)
-        data = dict(zip(field_names, values))
-        return data
-
-    @staticmethod
-    def unpack(bytestr: bytes) -> Dict[str, Union[str, int, bool]]:
-        """
-        Attempt to unpack a query packet.
+        Attempt to unpack a query packet starting at the given offset.
 
         Returns a dictionary of unpacked values, or throws an exception
         if this was not possible.
@@ -428,49 +548,13 @@ class RadAlertHIDQuery(generic.RadAlertQuery):
           * datalogging:  Flag indicating if the unit's datalogging function is active
           * unk2:         Unknown status flag
         """
-        # yapf: disable
-        fields = [
-            ("serial",    7, "s"),          # Serial (ASCII):       00 31 30 31 39 34 38
-            ("unkA",      7, "x"),          # Unknown (ASCII):      00 00 43 6f 2d 36 30
-            ("unkB",      2, "x"),          # Unknown:              00 00
-            ("status",    1, "B"),          # Mode number:          11
-            ("alarm",     1, "H"),          # Alarm CPM:            2e 04
-            ("unkC",      2, "x"),          # Unknown:              00 00
-            ("day",       1, "B"),          # Calibration day:      01
-            ("unkD",      2, "x"),          # Unknown:              02 17
-            ("month",     1, "B"),          # Calibration month:    01
-            ("year",      1, "B"),          # Calibration year:     00
-            ("unkE",      1, "x"),          # Unknown:              00
-            ("contrast",  1, "B"),          # LCD contrast:         19
-            ("dead",  1, "H"),              # Recip. deadtime:      67 2B
-            ("unkF",      8, "H"),          # Recip. efficiencies
-                                            # of 8 isotopes (C-14
-                                            # S-35, Cs-137, P-32,
-                                            # Co-60, Sr/Y-90,
-                                            # I-131, Alpha):        10 27 10 27 10 27 10 27 10 27 10 27 10 27 10 27
-            ("count_duration", 1, "H"),     # Count mode time (s):  58 02
-            ("backlight_duration", 1, "B"), # Backlight time (s):   07
-            ("conv",      1, "H"),          # CPM/(mR/H) convers:   2e 04
-            ("datalog_interval",  1, "H"),  # Datalogging interval: 01 00
-            ("unkG",     11, "x"),          # Unknown:              ff ff ff ff ff ff ff ff ff ff ff
-        ]
-        # yapf: enable
-        data = RadAlertHIDQuery._unpack_to_dict(fields, bytestr, "<", True)
+        values = RadAlertHIDQuery._STRUCT.unpack_from(bytestr, offset)
+        # dict(zip()) runs entirely in C and measures faster than a
+        # generated function building the same dict from a literal
+        data = dict(zip(RadAlertHIDQuery._FIELD_NAMES, values))
 
         # Unpack the status byte into its individual fields
-        status: int = int(data["status"])
-        # yapf: disable
-        data["auto_averaging"]   = bool((status >> 0) & 1)
-        data["datalog_circular"] = bool((status >> 1) & 1)
-        data["alarm_set"]        = bool((status >> 2) & 1)
-        data["audible_clicks"]   = bool((status >> 3) & 1)
-        data["audible_beeps"]    = bool((status >> 4) & 1)
-        data["unk1"]             = bool((status >> 5) & 1)
-        data["datalog_enabled"]  = bool((status >> 6) & 1)
-        data["unk2"]             = bool((status >> 7) & 1)
-        # yapf: enable
-
-        del data["status"]
+        data.update(RadAlertHIDQuery._STATUS_TABLE[int(data.pop("status"))])
 
         RadAlertHIDQuery._validate(data)
         return data
@@ -541,9 +625,10 @@ class RadAlertHID(generic.RadAlert):
     def _reset(self) -> None:
         self._command_buffer: List[Tuple[int, int]] = []
         self._receive_buffer: bytes = b""
-        self._poll_buffer: bytes = b""
+        self._poll_report: List[int] = []
         self._last_id: Optional[int] = None
         self._sync_count: int = 0
+        self._is_synced: bool = False
 
     def __init__(
         self,
@@ -582,9 +667,10 @@ class RadAlertHID(generic.RadAlert):
         can be used to force an update.
         """
         assert self._hiddev is not None
-        query = bytearray(self._hiddev.get_feature_report(0x00, 65))[1:]
+        # Skip over the report ID rather than slicing it off
+        report = bytes(self._hiddev.get_feature_report(0x00, 65))
         self._start()
-        return RadAlertHIDQuery(query)
+        return RadAlertHIDQuery(report, 1)
 
     def spin(self) -> NoReturn:
         """
@@ -609,11 +695,11 @@ class RadAlertHID(generic.RadAlert):
                     self.query_callback(query)
             print("Timeout while waiting for HID report", file=sys.stderr)
 
-    def _decode(self) -> Optional[RadAlertHIDStatus]:
+    def _decode(self, validate: bool = True) -> Optional[RadAlertHIDStatus]:
         if len(self._receive_buffer) != 15:
             return None
         # print(f'Decoding {self._receive_buffer.hex()}', file=sys.stderr)
-        data: RadAlertHIDStatus = RadAlertHIDStatus(self._receive_buffer)
+        data: RadAlertHIDStatus = RadAlertHIDStatus(self._receive_buffer, 0, validate)
 
         if self._last_id is not None:
             if (self._last_id + 1) % 256 != data.id:
@@ -623,23 +709,22 @@ class RadAlertHID(generic.RadAlert):
 
         self._last_id = data.id
 
-        # for value, expect in data._unknown:
-        #    if value != expect:
-        #        print(
-        #            f'NOTE: Data parsed from {self._receive_buffer.hex()}'
-        #            ' has unexpected unknown field values:'
-        #            f' {data._unknown}',
-        #            file=sys.stderr)
+        if not data._unknown_ok():
+            logger.debug(
+                "Data parsed from %s has unexpected unknown field values: %s",
+                self._receive_buffer.hex(),
+                data._unknown,
+            )
 
         self._receive_buffer = b""
-        # print(data._data)
+        logger.debug("Decoded status packet: id=%d cps=%d", data.id, data.cps)
         return data
 
     def _start(self) -> None:
         assert self._hiddev is not None
         self._hiddev.write(RadAlertHID._START)
 
-    def _poll(self) -> Optional[bytes]:
+    def _poll(self, timeout: float = 0.0) -> Optional[bytes]:
         """
         Poll the device for new data.
 
@@ -648,16 +733,21 @@ class RadAlertHID(generic.RadAlert):
         process the same data multiple times, this function also deduplicates
         the stream.
 
-        To keep track of the poll state, this function is a generator
-        which yeilds either a new set of bytes or None if the data is
-        unchagned.
+        The read blocks for up to `timeout` seconds waiting for a report
+        to arrive. Returns either a new set of bytes or None if nothing
+        arrived or the data is unchanged.
         """
         assert self._hiddev is not None
-        bytestr = bytes(self._hiddev.read(25))
-        if bytestr == self._poll_buffer:
+        # A zero timeout makes hidapi fall back to a plain read, which
+        # may block indefinitely, so always ask for at least 1 ms
+        timeout_ms = max(1, int(timeout * 1000))
+        # Compare the raw report list hidapi hands back against the
+        # previous one so that repeated packets never get copied to bytes
+        report = self._hiddev.read(25, timeout_ms)
+        if not report or report == self._poll_report:
             return None
-        self._poll_buffer = bytestr
-        return bytestr
+        self._poll_report = report
+        return bytes(report)
 
     def _wait_for_data(
         self, callback: Callable[[bytes], None], timeout: float, sleep: float = 0.2
@@ -665,20 +755,29 @@ class RadAlertHID(generic.RadAlert):
         """
         Wait to recieve new data for a limited amount of time.
 
-        Repeatedly poll the device until either new data is available
-        or the timeout is exceeded. When new data is available, call
-        the callback with it. Return `True` if the timeout did not
-        expire or `False` otherwise.
+        Repeatedly read from the device, blocking until a report arrives,
+        until either new data is available or the timeout is exceeded.
+        When new data is available, call the callback with it. Return
+        `True` if the timeout did not expire or `False` otherwise.
+
+        New data is handed over as soon as it is read, but the device
+        answers immediately with a repeat of its last report, so polls
+        which turn up nothing new are spaced at least `sleep` seconds
+        apart.
         """
         end_time = time.monotonic() + timeout
         while True:
-            data = self._poll()
+            start = time.monotonic()
+            data = self._poll(max(0.0, end_time - start))
             if data is not None:
                 callback(data)
                 return True
-            if time.monotonic() > end_time:
+            now = time.monotonic()
+            if now > end_time:
                 return False
-            time.sleep(sleep)
+            backoff = min(start + sleep, end_time) - now
+            if backoff > 0:
+                time.sleep(backoff)
 
     def _on_receive(self, bytestr: bytes) -> None:
         self._receive_buffer = bytestr
@@ -688,19 +787,28 @@ class RadAlertHID(generic.RadAlert):
         #    self._send_command(message)
 
     def _process(self) -> None:
-        self._synchronize()
-        while self._synchronized():
+        if not self._is_synced:
+            self._synchronize()
+        while self._is_synced:
             # print(f'Processing {self._receive_buffer.hex()}', file=sys.stderr)
+            if len(self._receive_buffer) != 15:
+                break
+            if not RadAlertHIDStatus._plausible(self._receive_buffer):
+                logger.warning(
+                    "Implausible status packet: %s", self._receive_buffer.hex()
+                )
+                self._desynchronize()
+                break
             try:
-                data = self._decode()
+                # The preflight above already range-checked the packet
+                data = self._decode(validate=False)
                 if data is None:
                     break
                 self._send_ack()
                 self.status_callback(data)
             except Exception as e:
-                print(
-                    "Failed to parse from:" f"{self._receive_buffer.hex()}\n{e}",
-                    file=sys.stderr,
+                logger.warning(
+                    "Failed to parse from:%s\n%s", self._receive_buffer.hex(), e
                 )
                 self._desynchronize()
 
@@ -717,21 +825,23 @@ class RadAlertHID(generic.RadAlert):
         such stale packets out of the system before we can reliably
         decode the data.
         """
-        while not self._synchronized():
+        while not self._is_synced:
             # print(f'Synchronizing {self._receive_buffer.hex()}', file=sys.stderr)
             try:
                 if self._decode() is None:
                     break
                 self._send_ack()
                 self._sync_count += 1
-                print(f"Decode success {self._sync_count}", file=sys.stderr)
+                self._is_synced = self._sync_count >= 5
+                logger.debug("Decode success %d", self._sync_count)
             except Exception as e:
-                print(f"Decode failure: {e}", file=sys.stderr)
+                logger.debug("Decode failure: %s", e)
                 self._sync_count = 0
                 self._last_id = None
 
     def _desynchronize(self) -> None:
         self._sync_count = 0
+        self._is_synced = False
 
     def _synchronized(self) -> bool:
-        return self._sync_count >= 5
+        return self._is_synced